@@ -98,101 +98,75 @@ def bio_analyze(data, sampling_rate=1000, method="auto", window_lengths='constan
 
     [1 rows x 84 columns]
     """
-    features = pd.DataFrame()
     method = method.lower()
 
     # Sanitize input
     if isinstance(data, pd.DataFrame):
-        ecg_cols = [col for col in data.columns if "ECG" in col]
-        rsp_cols = [col for col in data.columns if "RSP" in col]
-        eda_cols = [col for col in data.columns if "EDA" in col]
-        emg_cols = [col for col in data.columns if "EMG" in col]
-        ppg_cols = [col for col in data.columns if "PPG" in col]
-        eog_cols = [col for col in data.columns if "EOG" in col]
-        ecg_rate_col = [col for col in data.columns if "ECG_Rate" in col]
-        rsp_phase_col = [col for col in data.columns if "RSP_Phase" in col]
+        columns = data.columns
     elif isinstance(data, dict):
-        for i in data:
-            ecg_cols = [col for col in data[i].columns if "ECG" in col]
-            rsp_cols = [col for col in data[i].columns if "RSP" in col]
-            eda_cols = [col for col in data[i].columns if "EDA" in col]
-            emg_cols = [col for col in data[i].columns if "EMG" in col]
-            ppg_cols = [col for col in data[i].columns if "PPG" in col]
-            eog_cols = [col for col in data[i].columns if "EOG" in col]
-            ecg_rate_col = [col for col in data[i].columns if "ECG_Rate" in col]
-            rsp_phase_col = [col for col in data[i].columns if "RSP_Phase" in col]
+        columns = next(iter(data.values())).columns
     else:
         raise ValueError(
             "NeuroKit error: bio_analyze(): Wrong input, please make sure you enter a DataFrame or a dictionary. "
         )
 
+    # Find signal types from the prefix of the columns (vectorized over the column names)
+    signals = set(columns.str.extract(r"^([A-Z]+)", expand=False).dropna())
+    n_ecg_rate = columns.str.startswith("ECG_Rate").sum()  # Needed for RSA
+    n_rsp_phase = columns.str.startswith("RSP_Phase").sum()
+
+    parts = []
+
     # ECG
-    if len(ecg_cols) != 0:
-        ecg_data = data.copy()
-        if window_lengths != 'constant':
-            if 'ECG' in window_lengths.keys():  # only for epochs
-                ecg_data = _bio_analyze_slicewindow(ecg_data, window_lengths, signal='ECG')
+    if "ECG" in signals:
+        ecg_data = _bio_analyze_signaldata(data, window_lengths, signal='ECG')
 
         ecg_analyzed = ecg_analyze(ecg_data, sampling_rate=sampling_rate, method=method, subepoch_rate=subepoch_rate)
-        features = pd.concat([features, ecg_analyzed], axis=1, sort=False)
+        parts.append(ecg_analyzed)
 
     # RSP
-    if len(rsp_cols) != 0:
-        rsp_data = data.copy()
-
-        if window_lengths != 'constant':
-            if 'RSP' in window_lengths.keys():  # only for epochs
-                rsp_data = _bio_analyze_slicewindow(rsp_data, window_lengths, signal='RSP')
+    if "RSP" in signals:
+        rsp_data = _bio_analyze_signaldata(data, window_lengths, signal='RSP')
 
         rsp_analyzed = rsp_analyze(rsp_data, sampling_rate=sampling_rate, method=method, subepoch_rate=subepoch_rate)
-        features = pd.concat([features, rsp_analyzed], axis=1, sort=False)
+        parts.append(rsp_analyzed)
 
     # EDA
-    if len(eda_cols) != 0:
-        eda_data = data.copy()
-
-        if window_lengths != 'constant':
-            if 'EDA' in window_lengths.keys():  # only for epochs
-                eda_data = _bio_analyze_slicewindow(eda_data, window_lengths, signal='EDA')
+    if "EDA" in signals:
+        eda_data = _bio_analyze_signaldata(data, window_lengths, signal='EDA')
 
         eda_analyzed = eda_analyze(eda_data, sampling_rate=sampling_rate, method=method)
-        features = pd.concat([features, eda_analyzed], axis=1, sort=False)
+        parts.append(eda_analyzed)
 
     # EMG
-    if len(emg_cols) != 0:
-        emg_data = data.copy()
-
-        if window_lengths != 'constant':
-            if 'EMG' in window_lengths.keys():  # only for epochs
-                emg_data = _bio_analyze_slicewindow(emg_data, window_lengths, signal='EMG')
+    if "EMG" in signals:
+        emg_data = _bio_analyze_signaldata(data, window_lengths, signal='EMG')
 
         emg_analyzed = emg_analyze(emg_data, sampling_rate=sampling_rate, method=method)
-        features = pd.concat([features, emg_analyzed], axis=1, sort=False)
-
-    # EMG
-    if len(ppg_cols) != 0:
-        ppg_data = data.copy()
+        parts.append(emg_analyzed)
 
-        if window_lengths != 'constant':
-            if 'PPG' in window_lengths.keys():  # only for epochs
-                ppg_data = _bio_analyze_slicewindow(ppg_data, window_lengths, signal='PPG')
+    # PPG
+    if "PPG" in signals:
+        ppg_data = _bio_analyze_signaldata(data, window_lengths, signal='PPG')
 
         ppg_analyzed = ppg_analyze(ppg_data, sampling_rate=sampling_rate, method=method)
-        features = pd.concat([features, ppg_analyzed], axis=1, sort=False)
+        parts.append(ppg_analyzed)
 
     # EOG
-    if len(eog_cols) != 0:
-        eog_data = data.copy()
-
-        if window_lengths != 'constant':
-            if 'EOG' in window_lengths.keys():  # only for epochs
-                eog_data = _bio_analyze_slicewindow(eog_data, window_lengths, signal='EOG')
+    if "EOG" in signals:
+        eog_data = _bio_analyze_signaldata(data, window_lengths, signal='EOG')
 
         eog_analyzed = eog_analyze(eog_data, sampling_rate=sampling_rate, method=method)
-        features = pd.concat([features, eog_analyzed], axis=1, sort=False)
+        parts.append(eog_analyzed)
+
+    # Remove duplicate columns of Label and Condition (epoch information added by every signal).
+    # Other duplicates (e.g., the HRV_* features of both ECG and PPG) are kept on purpose.
+    info_cols = ["Event_Onset", "Label", "Condition", "Participant"]
+    for i in range(1, len(parts)):
+        parts[i] = parts[i].drop(columns=[col for col in info_cols if col in parts[i].columns])
 
     # RSA
-    if len(ecg_rate_col + rsp_phase_col) >= 3:
+    if n_ecg_rate + n_rsp_phase >= 3:
 
         # Event-related
         if method in ["event-related", "event", "epoch"]:
@@ -210,11 +184,9 @@ def bio_analyze(data, sampling_rate=1000, method="auto", window_lengths='constan
             else:
                 rsa = _bio_analyze_rsa_event(data)
 
-        features = pd.concat([features, rsa], axis=1, sort=False)
+        parts.append(rsa)
 
-    # Remove duplicate columns of Label and Condition
-    if "Label" in features.columns.values:
-        features = features.loc[:, ~features.columns.duplicated()]
+    features = pd.concat(parts, axis=1, sort=False) if parts else pd.DataFrame()
 
     return features
 
@@ -222,17 +194,28 @@ def bio_analyze(data, sampling_rate=1000, method="auto", window_lengths='constan
 # =============================================================================
 # Internals
 # =============================================================================
+def _bio_analyze_signaldata(data, window_lengths, signal='ECG'):
+    # Slice epochs only if a window is specified for this signal (no need to copy the whole data otherwise)
+    if window_lengths != 'constant' and signal in window_lengths.keys():
+        return _bio_analyze_slicewindow(data, window_lengths, signal=signal)
+    # The interval-related functions reassign the entries of dictionaries, so give each signal its own
+    if isinstance(data, dict):
+        return dict(data)
+    return data
+
+
 def _bio_analyze_slicewindow(data, window_lengths, signal='ECG'):
 
     if signal in window_lengths.keys():
         start = window_lengths[signal][0]
         end = window_lengths[signal][1]
         epochs = {}
-        for i, label in enumerate(data):
-            # Slice window
-            epoch = data[label].loc[(data[label].index > start) & (data[label].index < end)]
-            epochs[label] = epoch
-            epochs
+        for label, epoch in data.items():
+            # Slice window (the index of epochs is time, hence sorted)
+            idx = epoch.index.values
+            lower = np.searchsorted(idx, start, side="right")
+            upper = np.searchsorted(idx, end, side="left")
+            epochs[label] = epoch.iloc[lower:upper]
     return epochs
 
 
@@ -240,14 +223,14 @@ def _bio_analyze_findduration(data, sampling_rate=1000):
     # If DataFrame
     if isinstance(data, pd.DataFrame):
         if "Label" in data.columns:
-            labels = data["Label"].unique()
-            durations = [len(data[data["Label"] == label]) / sampling_rate for label in labels]
+            durations = data["Label"].value_counts(sort=False).values / sampling_rate
         else:
             durations = [len(data) / sampling_rate]
 
     # If dictionary
     if isinstance(data, dict):
-        durations = [len(data[i]) / sampling_rate for i in data]
+        durations = np.fromiter((len(epoch) for epoch in data.values()), dtype=np.float64, count=len(data))
+        durations = durations / sampling_rate
 
     return np.nanmean(durations)
 
@@ -255,23 +238,30 @@ def _bio_analyze_findduration(data, sampling_rate=1000):
 def _bio_analyze_rsa_interval(data, sampling_rate=1000):
     # RSA features for interval-related analysis
 
-
     if isinstance(data, pd.DataFrame):
-        rsa = hrv_rsa(data, sampling_rate=sampling_rate, continuous=False)
-        rsa = pd.DataFrame.from_dict(rsa, orient="index").T
+        rsa = hrv_rsa(data[_bio_analyze_rsa_columns(data)], sampling_rate=sampling_rate, continuous=False)
+        rsa = pd.DataFrame([rsa], dtype=float)
 
     elif isinstance(data, dict):
+        rsa = {}
         for index in data:
             rsa[index] = {}  # Initialize empty container
-            data[index] = data[index].set_index("Index").drop(["Label"], axis=1)
-            rsa[index] = hrv_rsa(data[index], sampling_rate=sampling_rate, continuous=False)
+            interval = data[index].set_index("Index")
+            interval = interval[_bio_analyze_rsa_columns(interval)]
+            rsa[index] = hrv_rsa(interval, sampling_rate=sampling_rate, continuous=False)
         rsa = pd.DataFrame.from_dict(rsa, orient="index")
 
     return rsa
 
 
-def _bio_analyze_rsa_event(data, rsa={}):
+def _bio_analyze_rsa_columns(data):
+    # Only keep the columns used by hrv_rsa() (heart rate, R-peaks and respiration)
+    return [col for col in data.columns if col.startswith(("ECG_Rate", "ECG_R_Peaks", "RSP_"))]
+
+
+def _bio_analyze_rsa_event(data, rsa=None):
     # RSA features for event-related analysis
+    rsa = {} if rsa is None else rsa
 
     if isinstance(data, dict):
         for i in data:
@@ -281,35 +271,38 @@ def _bio_analyze_rsa_event(data, rsa={}):
 
     elif isinstance(data, pd.DataFrame):
 
-        # Convert back to dict
-        for label, df in data.groupby('Label'):
+        # Sort once by epoch and slice each epoch (faster than grouping)
+        data = data.sort_values(["Label", "Time"])
+        labels, starts = np.unique(data["Label"].values, return_index=True)
+        ends = np.append(starts[1:], len(data))
+        for label, start, end in zip(labels, starts, ends):
             rsa[label] = {}
-            epoch = df.set_index('Time')
+            epoch = data.iloc[start:end]
+            epoch.index = epoch["Time"].values
             rsa[label] = _bio_analyze_rsa_epoch(epoch, rsa[label])
+        # Fix index sorting (numerically) to combine later with features dataframe
+        rsa = {str(label): rsa[label] for label in sorted(rsa, key=int)}
         rsa = pd.DataFrame.from_dict(rsa, orient="index")
-        # Fix index sorting to combine later with features dataframe
-        rsa.index = rsa.index.astype(int)
-        rsa = rsa.sort_index().rename_axis(None)
-        rsa.index = rsa.index.astype(str)
 
     return rsa
 
 
-def _bio_analyze_rsa_epoch(epoch, output={}):
+def _bio_analyze_rsa_epoch(epoch, output=None):
     # RSA features for event-related analysis: epoching
+    output = {} if output is None else output
 
-    # To remove baseline
-    if np.min(epoch.index.values) <= 0:
-        baseline = epoch["RSA_P2T"][epoch.index <= 0].values
-        signal = epoch["RSA_P2T"][epoch.index > 0].values
-        output["RSA_P2T"] = np.mean(signal) - np.mean(baseline)
-        baseline = epoch["RSA_Gates"][epoch.index <= 0].values
-        signal = epoch["RSA_Gates"][epoch.index > 0].values
-        output["RSA_Gates"] = np.nanmean(signal) - np.nanmean(baseline)
-    else:
-        signal = epoch["RSA_P2T"].values
-        output["RSA_P2T"] = np.mean(signal)
-        signal = epoch["RSA_Gates"].values
-        output["RSA_Gates"] = np.nanmean(signal)
+    # Extract the arrays once and compute the features on them directly
+    output["RSA_P2T"], output["RSA_Gates"] = _bio_analyze_rsa_stats(
+        epoch.index.values.astype(np.float64, copy=False), epoch["RSA_P2T"].values, epoch["RSA_Gates"].values
+    )
 
     return output
+
+
+def _bio_analyze_rsa_stats(time, p2t, gates):
+    # RSA features of an epoch, relative to baseline if any (time is sorted)
+    if time[0] <= 0:
+        split = np.searchsorted(time, 0.0, side="right")
+        return (np.mean(p2t[split:]) - np.mean(p2t[:split]), np.nanmean(gates[split:]) - np.nanmean(gates[:split]))
+
+    return np.mean(p2t), np.nanmean(gates)
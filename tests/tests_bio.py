@@ -47,9 +47,22 @@ def test_bio_analyze():
     labels = [int(i) for i in event_related["Label"]]
     assert labels == list(np.arange(1, len(epochs) + 1))
 
+    # Consecutive calls with fewer epochs should not keep results of previous calls
+    event_related = nk.bio_analyze({label: epochs[label] for label in list(epochs.keys())[:2]})
+    assert len(event_related) == 2
+
     # Example with interval-related analysis
     data = nk.data("bio_resting_8min_100hz")
     df, info = nk.bio_process(ecg=data["ECG"], rsp=data["RSP"], eda=data["EDA"], sampling_rate=100)
     interval_related = nk.bio_analyze(df)
 
     assert len(interval_related) == 1
+
+    # Example with interval-related analysis of epochs
+    data = nk.data("bio_resting_5min_100hz")
+    df, info = nk.bio_process(ecg=data["ECG"], rsp=data["RSP"], ppg=data["PPG"], sampling_rate=100)
+    epochs = nk.epochs_create(df, events=[0, 12000], sampling_rate=100, epochs_start=0, epochs_end=100)
+    interval_related = nk.bio_analyze(epochs, sampling_rate=100, method="interval-related")
+
+    assert len(interval_related) == 2
+    assert "RSA_P2T_Mean" in interval_related.columns